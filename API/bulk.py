@@ -0,0 +1,178 @@
+"""
+Bulk schedule import/export for the flight store.
+
+Usage:
+    python bulk.py import schedule.csv
+    python bulk.py import - --format ndjson < schedule.ndjson
+    python bulk.py export flights.ndjson
+
+Rows are streamed from the input, validated against FlightCreate in batches
+and written to the store in one atomic rewrite, with duplicates skipped
+through a key index built once per import. The rewrite holds the store's
+file lock, so API writes made meanwhile wait instead of being lost.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO
+
+from pydantic import TypeAdapter, ValidationError
+
+from config import FLIGHTS_FILE
+from log_setup import setup_logging
+from models import FlightCreate
+from storage import FlightStorage
+
+logger = logging.getLogger("flight-bulk")
+
+FIELDS = ["flightNumber", "arrivalTimestamp", "status", "delayInMinutes", "reasonCode", "updatedAt"]
+BATCH_SIZE = 1000
+
+_batch_adapter = TypeAdapter(list[FlightCreate])
+
+
+def _detect_format(path: str, fmt: str | None) -> str:
+    """Pick csv/ndjson from the explicit flag or the file extension."""
+    if fmt:
+        return fmt
+    if path.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    if path.endswith(".csv"):
+        return "csv"
+    raise SystemExit(f"Cannot infer format of {path!r}, pass --format csv|ndjson")
+
+
+@contextmanager
+def _open(path: str, mode: str) -> Iterator[IO[str]]:
+    """Open a file, or stdin/stdout for '-'."""
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+    else:
+        with open(path, mode, newline="") as f:
+            yield f
+
+
+def _read_rows(stream: IO[str], fmt: str) -> Iterator[tuple[int, dict | None]]:
+    """Yield (row number, raw row) from a CSV or NDJSON stream.
+
+    Unparseable NDJSON lines are logged and yielded as None.
+    """
+    if fmt == "csv":
+        reader = csv.reader(stream)
+        header = next(reader, [])
+        for row_no, values in enumerate(reader, start=1):
+            # Empty cells fall back to model defaults
+            yield row_no, {k: v for k, v in zip(header, values) if v}
+    else:
+        row_no = 0
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            row_no += 1
+            try:
+                yield row_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning("Row %d rejected: invalid JSON (%s)", row_no, e)
+                yield row_no, None
+
+
+def _validate_batch(batch: list[tuple[int, dict]]) -> tuple[list[FlightCreate], int]:
+    """Validate a batch at once, falling back to per-row checks on error."""
+    try:
+        return _batch_adapter.validate_python([row for _, row in batch]), 0
+    except ValidationError:
+        pass
+
+    valid = []
+    invalid = 0
+    for row_no, row in batch:
+        try:
+            valid.append(FlightCreate.model_validate(row))
+        except ValidationError as e:
+            invalid += 1
+            logger.warning("Row %d rejected: %s", row_no, e.errors(include_url=False))
+    return valid, invalid
+
+
+def import_flights(storage: FlightStorage, stream: IO[str], fmt: str) -> dict:
+    """Stream rows into storage; returns import counters."""
+    counts = {"read": 0, "created": 0, "duplicates": 0, "invalid": 0}
+
+    def validated() -> Iterator[FlightCreate]:
+        batch: list[tuple[int, dict]] = []
+        for row_no, row in _read_rows(stream, fmt):
+            counts["read"] += 1
+            if row is None:
+                counts["invalid"] += 1
+                continue
+            batch.append((row_no, row))
+            if len(batch) >= BATCH_SIZE:
+                valid, invalid = _validate_batch(batch)
+                counts["invalid"] += invalid
+                batch.clear()
+                yield from valid
+        if batch:
+            valid, invalid = _validate_batch(batch)
+            counts["invalid"] += invalid
+            yield from valid
+
+    counts["created"], counts["duplicates"] = storage.create_many(validated())
+    return counts
+
+
+def export_flights(storage: FlightStorage, stream: IO[str], fmt: str) -> int:
+    """Write all stored flights to a CSV or NDJSON stream."""
+    written = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for record in storage.iter_raw():
+            writer.writerow(record)
+            written += 1
+    else:
+        for record in storage.iter_raw():
+            stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+            written += 1
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import/export of flight schedules")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="Import flights from CSV/NDJSON")
+    imp.add_argument("path", help="Input file, or '-' for stdin")
+    imp.add_argument("--format", choices=["csv", "ndjson"])
+
+    exp = sub.add_parser("export", help="Export flights to CSV/NDJSON")
+    exp.add_argument("path", help="Output file, or '-' for stdout")
+    exp.add_argument("--format", choices=["csv", "ndjson"])
+
+    args = parser.parse_args(argv)
+    setup_logging(use_queue=False)
+    storage = FlightStorage(FLIGHTS_FILE)
+    fmt = _detect_format(args.path, args.format)
+
+    if args.command == "import":
+        with _open(args.path, "r") as f:
+            counts = import_flights(storage, f, fmt)
+        logger.info(
+            "Import done: read=%d created=%d duplicates=%d invalid=%d",
+            counts["read"], counts["created"], counts["duplicates"], counts["invalid"],
+        )
+        return 1 if counts["invalid"] else 0
+
+    with _open(args.path, "w") as f:
+        written = export_flights(storage, f, fmt)
+    logger.info("Exported %d flights", written)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,16 +9,41 @@ load_dotenv()
 # Paths
 BASE_DIR = Path(__file__).parent
 FLIGHTS_FILE = BASE_DIR / "flights.json"
+ARCHIVE_FILE = BASE_DIR / "flights_archive.ndjson.gz"
+INDEX_DB_FILE = BASE_DIR / "events.db"
 DEPLOYMENTS_FILE = BASE_DIR.parent / "dApp" / "deployments" / "localhost" / "addresses.json"
 
 # API Settings
 API_HOST = os.getenv("API_HOST", "127.0.0.1")
 API_PORT = int(os.getenv("API_PORT", "8000"))
 
+# Retention Settings
+# Flights whose arrival is older than the horizon are moved to ARCHIVE_FILE
+# Never shorter than the Hub's coverage grace period (GRACE_SECONDS = 24h after arrival)
+RETENTION_MIN_HORIZON_SECONDS = 24 * 3600
+RETENTION_HORIZON_SECONDS = max(
+    RETENTION_MIN_HORIZON_SECONDS,
+    int(os.getenv("RETENTION_HORIZON_SECONDS", str(7 * 24 * 3600))),
+)
+RETENTION_INTERVAL_SECONDS = int(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))
+
 # Blockchain Settings
 RPC_URL = os.getenv("RPC_URL", "http://127.0.0.1:8545")
 ORACLE_PRIVATE_KEY = os.getenv("ORACLE_PRIVATE_KEY", "")
 
 # Watcher Settings
 POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "5"))
+# An API edit is pushed only once no newer edit arrived for this long
+UPDATE_DEBOUNCE_SECONDS = int(os.getenv("UPDATE_DEBOUNCE_SECONDS", "10"))
+# Unmined update transactions older than this no longer block a new push
+PENDING_TX_TIMEOUT_SECONDS = int(os.getenv("PENDING_TX_TIMEOUT_SECONDS", "120"))
 API_BASE_URL = os.getenv("API_BASE_URL", f"http://{API_HOST}:{API_PORT}")
+# First block scanned when the event index is empty
+INDEX_START_BLOCK = int(os.getenv("INDEX_START_BLOCK", "0"))
+# Blocks per get_logs call; keep under the RPC provider's log range limit
+INDEX_BLOCK_WINDOW = int(os.getenv("INDEX_BLOCK_WINDOW", "2000"))
+
+# Logging Settings
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() in ("1", "true", "yes")
+LOG_RATE_LIMIT_SECONDS = int(os.getenv("LOG_RATE_LIMIT_SECONDS", "60"))
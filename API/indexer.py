@@ -0,0 +1,195 @@
+"""SQLite index of InsuranceHub events, fed by the oracle watcher."""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+
+from models import PolicyStatus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS policies (
+    policy_id INTEGER PRIMARY KEY,
+    holder TEXT NOT NULL,
+    holder_lc TEXT NOT NULL,
+    product_id INTEGER NOT NULL,
+    flight_id TEXT NOT NULL,
+    flight_number TEXT NOT NULL,
+    arrival_timestamp INTEGER NOT NULL,
+    premium_wei TEXT NOT NULL,
+    max_payout_wei TEXT NOT NULL,
+    purchased_at INTEGER NOT NULL,
+    coverage_end INTEGER NOT NULL,
+    status INTEGER NOT NULL DEFAULT 0,
+    payout_wei TEXT,
+    closed_at INTEGER,
+    tx_hash TEXT NOT NULL,
+    closed_tx_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_policies_holder ON policies (holder_lc);
+CREATE INDEX IF NOT EXISTS idx_policies_flight ON policies (flight_id);
+CREATE INDEX IF NOT EXISTS idx_policies_status ON policies (status, coverage_end);
+
+CREATE TABLE IF NOT EXISTS flight_updates (
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    flight_id TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    delay_in_minutes INTEGER NOT NULL,
+    reason_code INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS idx_flight_updates_flight ON flight_updates (flight_id, updated_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+POLICY_COLUMNS = (
+    "policy_id AS policyId, holder, product_id AS productId, flight_id AS flightId, "
+    "flight_number AS flightNumber, arrival_timestamp AS arrivalTimestamp, "
+    "premium_wei AS premiumPaid, max_payout_wei AS maxPayout, purchased_at AS purchasedAt, "
+    "coverage_end AS coverageEnd, status, payout_wei AS payoutWei, closed_at AS closedAt, "
+    "tx_hash AS txHash, closed_tx_hash AS closedTxHash"
+)
+
+UPDATE_COLUMNS = (
+    "flight_id AS flightId, status, delay_in_minutes AS delayInMinutes, "
+    "reason_code AS reasonCode, updated_at AS updatedAt, block_number AS blockNumber, "
+    "tx_hash AS txHash"
+)
+
+
+class EventIndex:
+    """Thread-safe SQLite store for indexed policy and flight events.
+
+    Writes come from the watcher; the API only reads. uint256 amounts are
+    stored as decimal strings since they do not fit SQLite integers.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ============ Writes ============
+
+    def get_last_block(self) -> int | None:
+        """Get the last block fully ingested, if any."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_block'").fetchone()
+            return row["value"] if row else None
+
+    def ingest(self, events: list[dict], last_block: int) -> None:
+        """Apply decoded events in chain order and advance last_block atomically.
+
+        Each event is a dict with "event", "args", "txHash", "logIndex",
+        "blockNumber" and "blockTimestamp". Re-ingesting a range is a no-op.
+        """
+        with self._lock, self._conn:
+            for ev in events:
+                handler = getattr(self, f"_on_{ev['event']}", None)
+                if handler:
+                    handler(ev)
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('last_block', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (last_block,),
+            )
+
+    def _on_PolicyPurchased(self, ev: dict) -> None:
+        a = ev["args"]
+        self._conn.execute(
+            "INSERT OR IGNORE INTO policies (policy_id, holder, holder_lc, product_id, flight_id, "
+            "flight_number, arrival_timestamp, premium_wei, max_payout_wei, purchased_at, "
+            "coverage_end, status, tx_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                a["policyId"], a["holder"], a["holder"].lower(), a["productId"], a["flightId"],
+                a["flightNumber"], a["arrivalTimestamp"], str(a["premiumWei"]),
+                str(a["maxPayoutWei"]), ev["blockTimestamp"], a["coverageEnd"],
+                PolicyStatus.ACTIVE, ev["txHash"],
+            ),
+        )
+
+    def _on_FlightStatusUpdated(self, ev: dict) -> None:
+        a = ev["args"]
+        self._conn.execute(
+            "INSERT OR IGNORE INTO flight_updates (tx_hash, log_index, flight_id, status, "
+            "delay_in_minutes, reason_code, updated_at, block_number) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                ev["txHash"], ev["logIndex"], a["flightId"], a["status"], a["delayInMinutes"],
+                a["reasonCode"], a["updatedAt"], ev["blockNumber"],
+            ),
+        )
+
+    def _on_PolicySettled(self, ev: dict) -> None:
+        a = ev["args"]
+        self._conn.execute(
+            "UPDATE policies SET status = ?, payout_wei = ?, closed_at = ?, closed_tx_hash = ? "
+            "WHERE policy_id = ?",
+            (PolicyStatus.SETTLED, str(a["payoutWei"]), ev["blockTimestamp"], ev["txHash"], a["policyId"]),
+        )
+
+    def _on_PolicyExpired(self, ev: dict) -> None:
+        a = ev["args"]
+        self._conn.execute(
+            "UPDATE policies SET status = ?, closed_at = ?, closed_tx_hash = ? WHERE policy_id = ?",
+            (PolicyStatus.EXPIRED, ev["blockTimestamp"], ev["txHash"], a["policyId"]),
+        )
+
+    # ============ Queries ============
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def policies_by_holder(self, holder: str) -> list[dict]:
+        """All policies bought by a holder, newest first."""
+        return self._query(
+            f"SELECT {POLICY_COLUMNS} FROM policies WHERE holder_lc = ? ORDER BY policy_id DESC",
+            (holder.lower(),),
+        )
+
+    def policies_by_flight(self, flight_id: str) -> list[dict]:
+        """All policies on a flight."""
+        return self._query(
+            f"SELECT {POLICY_COLUMNS} FROM policies WHERE flight_id = ? ORDER BY policy_id",
+            (flight_id.lower(),),
+        )
+
+    def active_policies(self, now: int) -> list[dict]:
+        """Active policies whose coverage has not ended yet."""
+        return self._query(
+            f"SELECT {POLICY_COLUMNS} FROM policies WHERE status = ? AND coverage_end >= ? ORDER BY policy_id",
+            (PolicyStatus.ACTIVE, now),
+        )
+
+    def flight_updates(self, flight_id: str) -> list[dict]:
+        """Oracle updates pushed for a flight, oldest first."""
+        return self._query(
+            f"SELECT {UPDATE_COLUMNS} FROM flight_updates WHERE flight_id = ? ORDER BY updated_at",
+            (flight_id.lower(),),
+        )
+
+    def settlements(self, holder: str | None = None, limit: int = 100) -> list[dict]:
+        """Settled policies, most recent first, optionally for one holder."""
+        if holder is None:
+            return self._query(
+                f"SELECT {POLICY_COLUMNS} FROM policies WHERE status = ? ORDER BY closed_at DESC LIMIT ?",
+                (PolicyStatus.SETTLED, limit),
+            )
+        return self._query(
+            f"SELECT {POLICY_COLUMNS} FROM policies WHERE status = ? AND holder_lc = ? "
+            "ORDER BY closed_at DESC LIMIT ?",
+            (PolicyStatus.SETTLED, holder.lower(), limit),
+        )
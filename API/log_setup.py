@@ -0,0 +1,120 @@
+"""Logging setup for long-running processes (queue-based, rate-limited)."""
+
+import atexit
+import logging
+import queue
+import time
+from collections.abc import Mapping
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
+
+from config import LOG_ASYNC, LOG_LEVEL, LOG_RATE_LIMIT_SECONDS
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeats of the same warning within a time window.
+
+    Records are grouped by (logger, level, message template, scalar args);
+    other args such as exceptions only contribute their type, so e.g. one
+    ConnectionError per flight still counts as the same warning. The first
+    record of a group passes; identical ones are dropped until the window has
+    elapsed, after which the next one passes with a count of what was dropped.
+    Idle groups are forgotten so memory stays bounded.
+    """
+
+    _SCALARS = (str, int, float, bool, type(None))
+
+    def __init__(self, window_seconds: float, min_level: int = logging.WARNING):
+        super().__init__()
+        self.window_seconds = window_seconds
+        self.min_level = min_level
+        self._lock = Lock()
+        # Key -> [last_emitted_at, suppressed_count]
+        self._seen: dict[tuple, list] = {}
+        self._last_pruned = time.monotonic()
+
+    def _key_arg(self, arg: object) -> object:
+        """Reduce an arg to something small and hashable for grouping."""
+        return arg if isinstance(arg, self._SCALARS) else type(arg).__name__
+
+    def _prune(self, now: float) -> None:
+        """Forget idle groups (caller holds the lock).
+
+        Groups with a pending suppressed count are kept one extra window so
+        the count can still be reported.
+        """
+        if now - self._last_pruned < self.window_seconds:
+            return
+        self._seen = {
+            k: v for k, v in self._seen.items()
+            if now - v[0] < (2 if v[1] else 1) * self.window_seconds
+        }
+        self._last_pruned = now
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window_seconds <= 0 or record.levelno < self.min_level:
+            return True
+
+        if isinstance(record.args, tuple):
+            key_args = tuple(self._key_arg(a) for a in record.args)
+        elif isinstance(record.args, Mapping):
+            key_args = tuple(sorted((str(k), self._key_arg(v)) for k, v in record.args.items()))
+        else:
+            key_args = ()
+        key = (record.name, record.levelno, str(record.msg), key_args)
+
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            entry = self._seen.get(key)
+            if entry is None:
+                self._seen[key] = [now, 0]
+                return True
+            if now - entry[0] < self.window_seconds:
+                entry[1] += 1
+                return False
+            suppressed = entry[1]
+            self._seen[key] = [now, 0]
+
+        # Only positional args can take an extra %d; mapping-style messages keep their form
+        if suppressed and isinstance(record.args, tuple):
+            record.msg = f"{record.msg} (suppressed %d repeats)"
+            record.args = record.args + (suppressed,)
+        return True
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    use_queue: bool = LOG_ASYNC,
+    rate_limit_seconds: float = LOG_RATE_LIMIT_SECONDS,
+) -> None:
+    """Configure the root logger.
+
+    With ``use_queue`` the caller only enqueues records; formatting of the
+    final line and stream I/O happen on a background listener thread.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        handler: logging.Handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+    else:
+        handler = stream_handler
+
+    handler.addFilter(RateLimitFilter(rate_limit_seconds))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    # httpx logs every request at INFO; keep it to problems only
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
@@ -1,22 +1,60 @@
 """FastAPI Flight Simulator - provides flight status data for the oracle."""
 
+import asyncio
+import logging
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
 
-from config import FLIGHTS_FILE
-from models import Flight, FlightCreate, FlightUpdate, FlightStatus
-from storage import FlightStorage
+from config import (
+    ARCHIVE_FILE,
+    FLIGHTS_FILE,
+    INDEX_DB_FILE,
+    RETENTION_HORIZON_SECONDS,
+    RETENTION_INTERVAL_SECONDS,
+)
+from indexer import EventIndex
+from models import (
+    Flight,
+    FlightCreate,
+    FlightStatus,
+    FlightUpdate,
+    IndexedFlightUpdate,
+    IndexedPolicy,
+    IndexStatus,
+)
+from storage import FlightArchive, FlightStorage
 
 
+logger = logging.getLogger("flight-api")
+
 storage = FlightStorage(FLIGHTS_FILE)
+archive = FlightArchive(ARCHIVE_FILE)
+event_index = EventIndex(INDEX_DB_FILE)
+
+
+async def retention_loop() -> None:
+    """Periodically move flights past the retention horizon to the archive."""
+    while True:
+        now = int(time.time())
+        cutoff = now - RETENTION_HORIZON_SECONDS
+        try:
+            # Flights with policies still active on-chain stay in the working store
+            active = await asyncio.to_thread(event_index.active_policies, now)
+            retain = {(p["flightNumber"], p["arrivalTimestamp"]) for p in active}
+            moved = await asyncio.to_thread(storage.archive_before, cutoff, archive, retain)
+            if moved:
+                logger.info("Archived %d flights arriving before %d", moved, cutoff)
+        except Exception as e:
+            logger.error("Retention run failed: %s", e, exc_info=True)
+        await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize sample flights on startup."""
+    """Initialize sample flights and start the retention task."""
     # Create sample flights if none exist
     if not storage.get_all():
         now = int(time.time())
@@ -48,7 +86,10 @@ async def lifespan(app: FastAPI):
                 storage.create(flight)
             except ValueError:
                 pass
+
+    retention_task = asyncio.create_task(retention_loop())
     yield
+    retention_task.cancel()
 
 
 app = FastAPI(
@@ -133,6 +174,62 @@ async def simulate_update(update: FlightUpdate):
     return flight
 
 
+@app.get("/archive/flights", response_model=list[Flight])
+async def list_archived_flights(
+    flight_number: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+):
+    """List archived flights (read-only)."""
+    return await asyncio.to_thread(archive.find, flight_number, limit, offset)
+
+
+@app.get("/archive/flights/{flight_number}/{arrival_timestamp}", response_model=Flight)
+async def get_archived_flight(flight_number: str, arrival_timestamp: int):
+    """Get an archived flight by flightNumber and arrivalTimestamp."""
+    flight = await asyncio.to_thread(archive.get, flight_number, arrival_timestamp)
+    if not flight:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Archived flight {flight_number}:{arrival_timestamp} not found",
+        )
+    return flight
+
+
+@app.get("/index/status", response_model=IndexStatus)
+async def index_status():
+    """Last block ingested by the event index (null if it never ran)."""
+    last_block = await asyncio.to_thread(event_index.get_last_block)
+    return IndexStatus(lastBlock=last_block)
+
+
+@app.get("/index/holders/{holder}/policies", response_model=list[IndexedPolicy])
+async def list_holder_policies(holder: str):
+    """List policies bought by a holder, from the local event index."""
+    return await asyncio.to_thread(event_index.policies_by_holder, holder)
+
+
+@app.get("/index/flights/{flight_id}/policies", response_model=list[IndexedPolicy])
+async def list_flight_policies(flight_id: str):
+    """List policies on a flight (0x-prefixed flightId), from the local event index."""
+    return await asyncio.to_thread(event_index.policies_by_flight, flight_id)
+
+
+@app.get("/index/flights/{flight_id}/updates", response_model=list[IndexedFlightUpdate])
+async def list_flight_updates(flight_id: str):
+    """List oracle updates recorded on-chain for a flight."""
+    return await asyncio.to_thread(event_index.flight_updates, flight_id)
+
+
+@app.get("/index/settlements", response_model=list[IndexedPolicy])
+async def list_settlements(
+    holder: str | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+):
+    """List settled policies, most recent first."""
+    return await asyncio.to_thread(event_index.settlements, holder, limit)
+
+
 @app.delete("/flights/{flight_number}/{arrival_timestamp}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_flight(flight_number: str, arrival_timestamp: int):
     """Delete a flight."""
@@ -13,6 +13,13 @@ class FlightStatus(IntEnum):
     DIVERTED = 4
 
 
+class PolicyStatus(IntEnum):
+    """Policy status enum - must match Solidity."""
+    ACTIVE = 0
+    SETTLED = 1
+    EXPIRED = 2
+
+
 class Flight(BaseModel):
     """Flight record model."""
     flightNumber: str = Field(..., description="Flight number (e.g., 'AF123')")
@@ -45,3 +52,38 @@ class FlightKey(BaseModel):
     """Model for flight identification."""
     flightNumber: str
     arrivalTimestamp: int
+
+
+class IndexedPolicy(BaseModel):
+    """Policy as reconstructed from on-chain events (amounts in wei, as strings)."""
+    policyId: int
+    holder: str
+    productId: int
+    flightId: str
+    flightNumber: str
+    arrivalTimestamp: int
+    premiumPaid: str
+    maxPayout: str
+    purchasedAt: int
+    coverageEnd: int
+    status: int = Field(..., ge=0, le=2, description="Policy status (0=Active, 1=Settled, 2=Expired)")
+    payoutWei: str | None = None
+    closedAt: int | None = None
+    txHash: str
+    closedTxHash: str | None = None
+
+
+class IndexedFlightUpdate(BaseModel):
+    """Oracle flight update as recorded on-chain."""
+    flightId: str
+    status: int
+    delayInMinutes: int
+    reasonCode: int
+    updatedAt: int
+    blockNumber: int
+    txHash: str
+
+
+class IndexStatus(BaseModel):
+    """Progress of the local event index."""
+    lastBlock: int | None = Field(default=None, description="Last block ingested, null if never run")
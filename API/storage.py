@@ -1,21 +1,49 @@
 """JSON file storage for flight data."""
 
+import fcntl
+import gzip
+import io
+import itertools
 import json
+import os
+import tempfile
 import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
 
-from models import Flight
+from models import Flight, FlightCreate
+
+# Compact encoder reused across records; building one per json.dumps call adds up
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+SAVE_BATCH = 10_000
 
 
 class FlightStorage:
-    """Thread-safe JSON file storage for flights."""
+    """Thread- and process-safe JSON file storage for flights.
+
+    Writers hold an exclusive flock on a sidecar lock file (shared with the
+    bulk CLI) and replace the file atomically, so readers never see a
+    partially written store.
+    """
 
     def __init__(self, file_path: Path):
         self.file_path = file_path
+        self.lock_path = file_path.with_name(file_path.name + ".lock")
         self._lock = Lock()
         self._ensure_file()
 
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Hold the in-process lock and the cross-process file lock."""
+        with self._lock, open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
     def _ensure_file(self) -> None:
         """Create the JSON file if it doesn't exist."""
         if not self.file_path.exists():
@@ -26,10 +54,27 @@ class FlightStorage:
         with open(self.file_path, "r") as f:
             return json.load(f)
 
-    def _save(self, flights: list[dict]) -> None:
-        """Save all flights to file."""
-        with open(self.file_path, "w") as f:
-            json.dump(flights, f, indent=2)
+    def _save(self, flights: Iterable[dict]) -> None:
+        """Save all flights to file, one compact record per line.
+
+        Records are streamed to a temp file which then replaces the store.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.file_path.parent, prefix=self.file_path.name + ".")
+        try:
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, "w") as f:
+                f.write("[")
+                sep = "\n"
+                it = iter(flights)
+                while batch := list(itertools.islice(it, SAVE_BATCH)):
+                    f.write(sep)
+                    f.write(",\n".join(map(_encode, batch)))
+                    sep = ",\n"
+                f.write("\n]\n")
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     @staticmethod
     def _make_key(flight_number: str, arrival_timestamp: int) -> str:
@@ -53,7 +98,7 @@ class FlightStorage:
 
     def create(self, flight: Flight) -> Flight:
         """Create a new flight."""
-        with self._lock:
+        with self._write_lock():
             data = self._load()
             # Check for duplicates
             for f in data:
@@ -66,6 +111,63 @@ class FlightStorage:
             self._save(data)
             return Flight(**flight_dict)
 
+    def create_many(self, flights: Iterable[Flight | FlightCreate]) -> tuple[int, int]:
+        """Create flights in a single atomic rewrite, skipping existing keys.
+
+        ``flights`` is consumed lazily while the new file is written, so new
+        records are never held in memory all at once. If it raises, the store
+        is left untouched. Returns (created, skipped).
+        """
+        with self._write_lock():
+            data = self._load()
+            keys = {self._make_key(f["flightNumber"], f["arrivalTimestamp"]) for f in data}
+            now = int(time.time())
+            counts = {"created": 0, "skipped": 0}
+
+            def new_records() -> Iterator[dict]:
+                for flight in flights:
+                    key = self._make_key(flight.flightNumber, flight.arrivalTimestamp)
+                    if key in keys:
+                        counts["skipped"] += 1
+                        continue
+                    keys.add(key)
+                    # Fields are plain scalars, so a shallow copy is enough
+                    flight_dict = dict(flight.__dict__, updatedAt=now)
+                    counts["created"] += 1
+                    yield flight_dict
+
+            self._save(itertools.chain(data, new_records()))
+            return counts["created"], counts["skipped"]
+
+    def iter_raw(self) -> Iterator[dict]:
+        """Iterate over stored flight records as plain dicts."""
+        with self._lock:
+            data = self._load()
+        yield from data
+
+    def archive_before(
+        self,
+        cutoff: int,
+        archive: "FlightArchive",
+        retain: set[tuple[str, int]] = frozenset(),
+    ) -> int:
+        """Move flights arriving before cutoff into the archive.
+
+        Flights whose (flightNumber, arrivalTimestamp) is in ``retain`` stay
+        in the store regardless of age. Returns the number of flights archived.
+        """
+        with self._write_lock():
+            data = self._load()
+            keep, old = [], []
+            for f in data:
+                expired = f["arrivalTimestamp"] < cutoff and (f["flightNumber"], f["arrivalTimestamp"]) not in retain
+                (old if expired else keep).append(f)
+            if old:
+                # Archive first: a crash in between duplicates rather than loses records
+                archive.append(old)
+                self._save(keep)
+            return len(old)
+
     def update(
         self,
         flight_number: str,
@@ -75,7 +177,7 @@ class FlightStorage:
         reason_code: int | None = None,
     ) -> Flight | None:
         """Update a flight and increment updatedAt."""
-        with self._lock:
+        with self._write_lock():
             data = self._load()
             for i, f in enumerate(data):
                 if f["flightNumber"] == flight_number and f["arrivalTimestamp"] == arrival_timestamp:
@@ -94,7 +196,7 @@ class FlightStorage:
 
     def delete(self, flight_number: str, arrival_timestamp: int) -> bool:
         """Delete a flight."""
-        with self._lock:
+        with self._write_lock():
             data = self._load()
             original_len = len(data)
             data = [
@@ -105,3 +207,133 @@ class FlightStorage:
                 self._save(data)
                 return True
             return False
+
+
+class _BoundedReader(io.RawIOBase):
+    """Read-only view of a binary file that stops after ``limit`` bytes."""
+
+    def __init__(self, raw: io.BufferedReader, limit: int):
+        self._raw = raw
+        self._left = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._left)
+        if size <= 0:
+            return 0
+        data = self._raw.read(size)
+        buffer[:len(data)] = data
+        self._left -= len(data)
+        return len(data)
+
+
+class FlightArchive:
+    """Append-only, gzip-compressed NDJSON archive of retired flights.
+
+    Records are written in gzip members of at most MEMBER_SIZE lines. A
+    sidecar index maps each flight key to the byte offset of the member
+    holding its latest copy, so lookups decompress one member instead of
+    the whole archive. Readers stop at the end of the last fully written
+    member, so they never see a member that is still being appended.
+    """
+
+    MEMBER_SIZE = 1000
+
+    def __init__(self, file_path: Path):
+        self.file_path = file_path
+        self.index_path = file_path.with_name(file_path.name + ".idx")
+        self._lock = Lock()
+        self._offsets: dict[tuple[str, int], int] | None = None
+        self._end: int | None = None
+
+    def _index(self) -> dict[tuple[str, int], int]:
+        """Load the key -> member offset index on first use (caller holds the lock)."""
+        if self._offsets is None:
+            self._offsets = {}
+            if self.index_path.exists():
+                with open(self.index_path) as f:
+                    for line in f:
+                        flight_number, arrival_timestamp, offset = json.loads(line)
+                        self._offsets[(flight_number, arrival_timestamp)] = offset
+        return self._offsets
+
+    def _committed_end(self) -> int:
+        """Byte offset just past the last complete member."""
+        with self._lock:
+            if self._end is None:
+                self._end = self.file_path.stat().st_size if self.file_path.exists() else 0
+            return self._end
+
+    def append(self, flights: list[dict]) -> None:
+        """Append flight records as new gzip members and index them."""
+        with self._lock:
+            index = self._index()
+            with open(self.file_path, "ab") as raw, open(self.index_path, "a") as idx:
+                for start in range(0, len(flights), self.MEMBER_SIZE):
+                    member = flights[start:start + self.MEMBER_SIZE]
+                    offset = raw.tell()
+                    with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                        gz.write("".join(_encode(f) + "\n" for f in member).encode("utf-8"))
+                    for f in member:
+                        key = (f["flightNumber"], f["arrivalTimestamp"])
+                        idx.write(_encode([key[0], key[1], offset]) + "\n")
+                        index[key] = offset
+                raw.flush()
+                self._end = raw.tell()
+
+    def _iter(self, offset: int = 0, max_lines: int | None = None) -> Iterator[dict]:
+        """Iterate over archived records from a member offset, oldest first."""
+        end = self._committed_end()
+        if offset >= end:
+            return
+        with open(self.file_path, "rb") as raw:
+            raw.seek(offset)
+            with gzip.GzipFile(fileobj=_BoundedReader(raw, end - offset), mode="rb") as gz:
+                for n, line in enumerate(gz):
+                    if max_lines is not None and n >= max_lines:
+                        return
+                    if line.strip():
+                        yield json.loads(line)
+
+    def _read_at(self, key: tuple[str, int], offset: int) -> dict | None:
+        """Read the last copy of a flight from the member at offset."""
+        found = None
+        for f in self._iter(offset, self.MEMBER_SIZE):
+            if (f["flightNumber"], f["arrivalTimestamp"]) == key:
+                found = f
+        return found
+
+    def find(self, flight_number: str | None = None, limit: int = 100, offset: int = 0) -> list[Flight]:
+        """List archived flights, optionally filtered by flight number.
+
+        Filtered queries go through the index. Unfiltered ones scan from the
+        start of the archive, so their cost grows with ``offset``.
+        """
+        if flight_number is None:
+            results = []
+            for n, f in enumerate(self._iter()):
+                if n < offset:
+                    continue
+                results.append(Flight(**f))
+                if len(results) >= limit:
+                    break
+            return results
+
+        with self._lock:
+            keys = sorted(
+                (key, member) for key, member in self._index().items() if key[0] == flight_number
+            )[offset:offset + limit]
+        records = (self._read_at(key, member) for key, member in keys)
+        return [Flight(**f) for f in records if f]
+
+    def get(self, flight_number: str, arrival_timestamp: int) -> Flight | None:
+        """Get the most recently archived copy of a flight."""
+        key = (flight_number, arrival_timestamp)
+        with self._lock:
+            member = self._index().get(key)
+        if member is None:
+            return None
+        found = self._read_at(key, member)
+        return Flight(**found) if found else None
@@ -5,32 +5,38 @@ This long-lived process:
 1. Discovers new policies on-chain (PolicyPurchased events)
 2. Fetches the corresponding flight from the API
 3. Pushes updateFlightStatus(FlightData) to the Hub when updatedAt changes
+4. Records Hub events in the local event index served by the API
 """
 
 import asyncio
 import json
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 import httpx
 from eth_abi import encode
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
+from web3.logs import DISCARD
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from config import (
     API_BASE_URL,
     DEPLOYMENTS_FILE,
+    INDEX_BLOCK_WINDOW,
+    INDEX_DB_FILE,
+    INDEX_START_BLOCK,
     ORACLE_PRIVATE_KEY,
+    PENDING_TX_TIMEOUT_SECONDS,
     POLL_INTERVAL_SECONDS,
     RPC_URL,
+    UPDATE_DEBOUNCE_SECONDS,
 )
+from indexer import EventIndex
+from log_setup import setup_logging
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger("oracle-watcher")
 
 
@@ -52,6 +58,38 @@ HUB_ABI = [
         "name": "PolicyPurchased",
         "type": "event",
     },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "flightId", "type": "bytes32"},
+            {"indexed": False, "name": "status", "type": "uint8"},
+            {"indexed": False, "name": "delayInMinutes", "type": "uint32"},
+            {"indexed": False, "name": "reasonCode", "type": "uint16"},
+            {"indexed": False, "name": "updatedAt", "type": "uint64"},
+        ],
+        "name": "FlightStatusUpdated",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "policyId", "type": "uint256"},
+            {"indexed": True, "name": "holder", "type": "address"},
+            {"indexed": False, "name": "payoutWei", "type": "uint256"},
+            {"indexed": False, "name": "flightId", "type": "bytes32"},
+        ],
+        "name": "PolicySettled",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "policyId", "type": "uint256"},
+            {"indexed": False, "name": "flightId", "type": "bytes32"},
+        ],
+        "name": "PolicyExpired",
+        "type": "event",
+    },
     {
         "inputs": [
             {
@@ -82,6 +120,11 @@ HUB_ABI = [
     },
 ]
 
+# Hub events recorded in the local event index
+INDEXED_EVENTS = ("PolicyPurchased", "FlightStatusUpdated", "PolicySettled", "PolicyExpired")
+# Cap on block windows scanned per cycle while the index catches up
+MAX_WINDOWS_PER_CYCLE = 50
+
 
 @dataclass
 class TrackedFlight:
@@ -94,6 +137,44 @@ class TrackedFlight:
     last_seen_updated_at: int = 0
 
 
+@dataclass
+class PendingUpdate:
+    """Newest API state for a flight not yet confirmed on-chain."""
+
+    data: dict
+    updated_at: int
+    # Watcher-local monotonic time this updatedAt was first seen (for debounce)
+    first_seen_at: float = 0.0
+    # In-flight transaction, if any, and the updatedAt it carries
+    tx_hash: bytes | None = None
+    tx_updated_at: int = 0
+    tx_nonce: int = 0
+    tx_gas_price: int = 0
+    sent_at: float = 0.0
+    # Unmined past PENDING_TX_TIMEOUT_SECONDS; the next push replaces it
+    stuck: bool = False
+
+
+@dataclass
+class CycleStats:
+    """Counters for one watcher cycle, logged as a single summary line."""
+
+    new_policies: int = 0
+    checked: int = 0
+    unchanged: int = 0
+    debounced: int = 0
+    in_flight: int = 0
+    pushed: int = 0
+    confirmed: int = 0
+    failed: int = 0
+    missing: int = 0
+    expired: int = 0
+
+    def reset(self) -> None:
+        for f in fields(self):
+            setattr(self, f.name, 0)
+
+
 class OracleWatcher:
     """Watches for PolicyPurchased events and pushes flight updates to the Hub."""
 
@@ -113,14 +194,22 @@ class OracleWatcher:
         if not ORACLE_PRIVATE_KEY:
             raise ValueError("ORACLE_PRIVATE_KEY environment variable is required")
         self.oracle_account = self.w3.eth.account.from_key(ORACLE_PRIVATE_KEY)
-        logger.info(f"Oracle address: {self.oracle_account.address}")
+        logger.info("Oracle address: %s", self.oracle_account.address)
 
         # Track flights with active policies
         # Key: (flightNumber, arrivalTimestamp) -> TrackedFlight
         self.tracked_flights: dict[tuple[str, int], TrackedFlight] = {}
 
-        # Track the last processed block
-        self.last_processed_block = 0
+        # Event index; resume scanning after the last block it holds
+        self.index = EventIndex(INDEX_DB_FILE)
+        self.last_processed_block: int | None = self.index.get_last_block()
+        self._restore_tracked_flights()
+
+        # Unconfirmed updates by flightId, coalesced to the newest updatedAt
+        self.pending_updates: dict[bytes, PendingUpdate] = {}
+
+        # Per-cycle counters for the summary log line
+        self.stats = CycleStats()
 
         # HTTP client for API calls
         self.http_client = httpx.AsyncClient(base_url=API_BASE_URL, timeout=10.0)
@@ -140,74 +229,144 @@ class OracleWatcher:
             if response.status_code == 200:
                 return response.json()
             elif response.status_code == 404:
-                logger.warning(f"Flight {flight_number}:{arrival_timestamp} not found in API")
+                logger.warning("Flight %s:%s not found in API", flight_number, arrival_timestamp)
                 return None
             else:
-                logger.error(f"API error: {response.status_code} - {response.text}")
+                logger.error("API error: %s - %s", response.status_code, response.text)
                 return None
         except Exception as e:
-            logger.error(f"Failed to fetch flight from API: {e}")
+            logger.error("Failed to fetch flight from API: %s", e)
             return None
 
+    def _track(self, flight_id: bytes, flight_number: str, arrival_timestamp: int, coverage_end: int) -> bool:
+        """Start tracking a flight; returns False if it was already tracked."""
+        key = (flight_number, arrival_timestamp)
+        if key in self.tracked_flights:
+            return False
+        self.tracked_flights[key] = TrackedFlight(
+            flight_id=flight_id,
+            flight_number=flight_number,
+            arrival_timestamp=arrival_timestamp,
+            coverage_end=coverage_end,
+        )
+        return True
+
+    def _restore_tracked_flights(self) -> None:
+        """Resume tracking flights with active policies found in the event index."""
+        for policy in self.index.active_policies(int(time.time())):
+            self._track(
+                Web3.to_bytes(hexstr=policy["flightId"]),
+                policy["flightNumber"],
+                policy["arrivalTimestamp"],
+                policy["coverageEnd"],
+            )
+        if self.tracked_flights:
+            logger.info("Restored %d tracked flights from the event index", len(self.tracked_flights))
+
+    def _fetch_events(self, from_block: int, to_block: int) -> list[dict]:
+        """Fetch and decode indexed Hub events in chain order."""
+        logs = []
+        for name in INDEXED_EVENTS:
+            logs.extend(getattr(self.hub.events, name).get_logs(from_block=from_block, to_block=to_block))
+        logs.sort(key=lambda log: (log.blockNumber, log.logIndex))
+
+        block_timestamps: dict[int, int] = {}
+        events = []
+        for log in logs:
+            if log.blockNumber not in block_timestamps:
+                block_timestamps[log.blockNumber] = self.w3.eth.get_block(log.blockNumber).timestamp
+            events.append({
+                "event": log.event,
+                "args": {
+                    k: Web3.to_hex(v) if isinstance(v, bytes) else v
+                    for k, v in log.args.items()
+                },
+                "txHash": Web3.to_hex(log.transactionHash),
+                "logIndex": log.logIndex,
+                "blockNumber": log.blockNumber,
+                "blockTimestamp": block_timestamps[log.blockNumber],
+            })
+        return events
+
     def _discover_new_policies(self) -> None:
-        """Scan for new PolicyPurchased events and track flights."""
+        """Scan new blocks for Hub events, index them and track new flights.
+
+        Blocks are scanned in windows of INDEX_BLOCK_WINDOW, saving progress
+        after each one, so a long catch-up survives RPC log-range limits and
+        resumes where it stopped. At most MAX_WINDOWS_PER_CYCLE windows are
+        scanned per cycle so tracked flights keep being served meanwhile.
+        """
         current_block = self.w3.eth.block_number
 
-        if self.last_processed_block == 0:
-            # On first run, look back some blocks
-            self.last_processed_block = max(0, current_block - 1000)
-            logger.info(f"First run - scanning from block {self.last_processed_block}")
+        if self.last_processed_block is None:
+            from_block = INDEX_START_BLOCK
+            logger.info("Empty event index - scanning from block %d", from_block)
+        else:
+            from_block = self.last_processed_block + 1
 
-        if current_block <= self.last_processed_block:
-            logger.debug(f"No new blocks (current: {current_block}, last: {self.last_processed_block})")
+        if current_block < from_block:
+            logger.debug("No new blocks (current: %d, last: %s)", current_block, self.last_processed_block)
             return
 
-        logger.debug(
-            f"Scanning blocks {self.last_processed_block + 1} to {current_block}"
-        )
+        for _ in range(MAX_WINDOWS_PER_CYCLE):
+            if from_block > current_block:
+                break
+            to_block = min(from_block + INDEX_BLOCK_WINDOW - 1, current_block)
+            logger.debug("Scanning blocks %d to %d", from_block, to_block)
 
-        # Get PolicyPurchased events
-        try:
-            events = self.hub.events.PolicyPurchased.get_logs(
-                from_block=self.last_processed_block + 1, to_block=current_block
-            )
-            logger.debug(f"Found {len(events)} PolicyPurchased events")
-        except Exception as e:
-            logger.error(f"Failed to get PolicyPurchased events: {e}")
-            return
+            try:
+                events = self._fetch_events(from_block, to_block)
+                logger.debug("Found %d Hub events", len(events))
+            except Exception as e:
+                logger.error("Failed to get Hub events for blocks %d-%d: %s", from_block, to_block, e)
+                return
 
+            self.index.ingest(events, to_block)
+            self._track_purchases(events)
+            self.last_processed_block = to_block
+            from_block = to_block + 1
+
+        if from_block <= current_block:
+            logger.info("Event index catching up: at block %d of %d", self.last_processed_block, current_block)
+
+    def _track_purchases(self, events: list[dict]) -> None:
+        """Start tracking flights from decoded PolicyPurchased events."""
         for event in events:
-            flight_number = event.args.flightNumber
-            arrival_timestamp = event.args.arrivalTimestamp
-            flight_id = event.args.flightId
-            coverage_end = event.args.coverageEnd
-            policy_id = event.args.policyId
-            holder = event.args.holder
-
-            key = (flight_number, arrival_timestamp)
-            if key not in self.tracked_flights:
-                self.tracked_flights[key] = TrackedFlight(
-                    flight_id=flight_id,
-                    flight_number=flight_number,
-                    arrival_timestamp=arrival_timestamp,
-                    coverage_end=coverage_end,
-                )
-                logger.info(
-                    f"✅ New policy #{policy_id} discovered!\n"
-                    f"   Flight: {flight_number}\n"
-                    f"   Holder: {holder}\n"
-                    f"   Arrival: {arrival_timestamp}\n"
-                    f"   Coverage end: {coverage_end}\n"
-                    f"   FlightId: {flight_id.hex()}"
+            if event["event"] != "PolicyPurchased":
+                continue
+            args = event["args"]
+            flight_number = args["flightNumber"]
+            policy_id = args["policyId"]
+
+            tracked = self._track(
+                Web3.to_bytes(hexstr=args["flightId"]),
+                flight_number,
+                args["arrivalTimestamp"],
+                args["coverageEnd"],
+            )
+            if tracked:
+                self.stats.new_policies += 1
+                logger.debug(
+                    "New policy #%s discovered: flight=%s holder=%s arrival=%s coverage_end=%s flightId=%s",
+                    policy_id, flight_number, args["holder"], args["arrivalTimestamp"],
+                    args["coverageEnd"], args["flightId"],
                 )
             else:
-                logger.debug(f"Policy #{policy_id} for already tracked flight {flight_number}")
-
-        self.last_processed_block = current_block
-        logger.debug(f"Now tracking {len(self.tracked_flights)} flights")
-
-    async def _push_flight_update(self, flight: TrackedFlight, api_data: dict) -> bool:
-        """Push a flight status update to the Hub contract."""
+                logger.debug("Policy #%s for already tracked flight %s", policy_id, flight_number)
+
+    async def _push_flight_update(
+        self,
+        flight: TrackedFlight,
+        api_data: dict,
+        nonce: int | None = None,
+        min_gas_price: int = 0,
+    ) -> tuple[bytes, int, int] | None:
+        """Send a flight status update to the Hub contract without waiting for it.
+
+        Pass the nonce of a stuck transaction (and a higher gas price) to
+        replace it. Returns (tx hash, nonce, gas price), or None if it could
+        not be sent.
+        """
         try:
             flight_data = (
                 flight.flight_id,
@@ -219,14 +378,14 @@ class OracleWatcher:
                 api_data["updatedAt"],
             )
 
-            logger.debug(f"Building transaction for updateFlightStatus...")
-            logger.debug(f"  FlightData: {flight_data}")
+            logger.debug("Building updateFlightStatus transaction, FlightData: %s", flight_data)
 
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.oracle_account.address)
-            gas_price = self.w3.eth.gas_price
+            # Build transaction; count pending txs so concurrent sends get distinct nonces
+            if nonce is None:
+                nonce = self.w3.eth.get_transaction_count(self.oracle_account.address, "pending")
+            gas_price = max(self.w3.eth.gas_price, min_gas_price)
 
-            logger.debug(f"  Nonce: {nonce}, Gas price: {gas_price}")
+            logger.debug("  Nonce: %d, Gas price: %d", nonce, gas_price)
 
             tx = self.hub.functions.updateFlightStatus(flight_data).build_transaction(
                 {
@@ -237,165 +396,239 @@ class OracleWatcher:
                 }
             )
 
-            logger.debug(f"  Transaction built, signing...")
-
             # Sign and send
             signed_tx = self.w3.eth.account.sign_transaction(
                 tx, private_key=ORACLE_PRIVATE_KEY
             )
 
-            logger.debug(f"  Sending transaction...")
             tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            logger.info(f"📤 Transaction sent: {tx_hash.hex()}")
+            logger.debug("  Transaction sent: %s", tx_hash.hex())
+            return tx_hash, nonce, gas_price
 
-            # Wait for receipt
-            logger.debug(f"  Waiting for receipt...")
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
-
-            if receipt.status == 1:
-                logger.info(
-                    f"✅ Transaction successful!\n"
-                    f"   TX: {tx_hash.hex()}\n"
-                    f"   Gas used: {receipt.gasUsed}\n"
-                    f"   Block: {receipt.blockNumber}"
-                )
+        except Exception as e:
+            logger.error("❌ Failed to push flight update for %s: %s", flight.flight_number, e, exc_info=True)
+            return None
 
-                # Check for PolicySettled events in the receipt
-                for log in receipt.logs:
-                    try:
-                        # PolicySettled event topic
-                        if len(log.topics) > 0:
-                            topic = log.topics[0].hex()
-                            # Check if this is a PolicySettled event (keccak256 of event signature)
-                            if topic == "0x" + self.w3.keccak(text="PolicySettled(uint256,address,uint256,bytes32)").hex():
-                                logger.info(f"💰 PAYOUT TRIGGERED! Check holder wallet for incoming ETH")
-                    except Exception:
-                        pass
+    def _resolve_pending_tx(self, flight: TrackedFlight, pending: PendingUpdate) -> bool:
+        """Check the receipt of a flight's in-flight transaction.
 
+        Returns True once the transaction is resolved, False while it is
+        still pending. A transaction unmined after PENDING_TX_TIMEOUT_SECONDS
+        is marked stuck so the caller can replace it under the same nonce,
+        unless that nonce has already been used by another mined transaction.
+        """
+        try:
+            receipt = self.w3.eth.get_transaction_receipt(pending.tx_hash)
+        except TransactionNotFound:
+            if time.monotonic() - pending.sent_at < PENDING_TX_TIMEOUT_SECONDS:
+                return False
+            # An earlier transaction under the same nonce may have landed instead
+            chain_updated_at = self.hub.functions.lastUpdatedAtByFlightId(flight.flight_id).call()
+            if chain_updated_at >= pending.tx_updated_at:
+                flight.last_seen_updated_at = max(flight.last_seen_updated_at, chain_updated_at)
+                pending.tx_hash = None
+                pending.stuck = False
+                self.stats.confirmed += 1
                 return True
-            else:
-                logger.error(
-                    f"❌ Transaction FAILED!\n"
-                    f"   TX: {tx_hash.hex()}\n"
-                    f"   This could mean the policy was already settled or expired"
+            # The nonce went to a transaction we are not tracking (e.g. the original
+            # of a replacement); the next push must use a fresh nonce
+            mined_nonce = self.w3.eth.get_transaction_count(self.oracle_account.address, "latest")
+            if mined_nonce > pending.tx_nonce:
+                logger.warning(
+                    "Nonce %d for %s was used by another transaction, pushing again with a new nonce",
+                    pending.tx_nonce, flight.flight_number,
                 )
-                return False
-
-        except Exception as e:
-            logger.error(f"❌ Failed to push flight update: {e}", exc_info=True)
+                pending.tx_hash = None
+                pending.stuck = False
+                return True
+            if not pending.stuck:
+                logger.warning(
+                    "Transaction %s for %s still pending after %ss, replacing it (nonce %d)",
+                    pending.tx_hash.hex(), flight.flight_number, PENDING_TX_TIMEOUT_SECONDS, pending.tx_nonce,
+                )
+                pending.stuck = True
             return False
 
+        tx_hash = pending.tx_hash
+        pending.tx_hash = None
+        pending.stuck = False
+        if receipt.status == 1:
+            flight.last_seen_updated_at = max(flight.last_seen_updated_at, pending.tx_updated_at)
+            self.stats.confirmed += 1
+            logger.info(
+                "✅ %s updated: tx=%s gas=%d block=%d",
+                flight.flight_number, tx_hash.hex(), receipt.gasUsed, receipt.blockNumber,
+            )
+
+            # Settlements are indexed on the next scan; just report them here
+            settled = self.hub.events.PolicySettled().process_receipt(receipt, errors=DISCARD)
+            if settled:
+                logger.info(
+                    "💰 PAYOUT TRIGGERED for %s: %d policies settled",
+                    flight.flight_number, len(settled),
+                )
+        else:
+            self.stats.failed += 1
+            logger.error(
+                "❌ Transaction FAILED for %s: tx=%s (policy may already be settled or expired)",
+                flight.flight_number, tx_hash.hex(),
+            )
+        return True
+
     async def _process_tracked_flights(self) -> None:
-        """Check API for updates on tracked flights and push to blockchain."""
+        """Check API for updates on tracked flights and push to blockchain.
+
+        Updates are coalesced per flightId: while a transaction is in flight
+        no other push is sent for that flight, and only the newest API state
+        is pushed once it has been stable for UPDATE_DEBOUNCE_SECONDS.
+        """
         now = int(time.time())
         expired_keys = []
 
-        logger.debug(f"Processing {len(self.tracked_flights)} tracked flights (current time: {now})")
-
         for key, flight in self.tracked_flights.items():
             # Skip expired flights (coverage already ended)
             if now > flight.coverage_end:
-                logger.info(
-                    f"⏰ Flight {flight.flight_number} coverage expired "
-                    f"(now={now} > coverage_end={flight.coverage_end})"
+                logger.debug(
+                    "Flight %s coverage expired (now=%d > coverage_end=%d)",
+                    flight.flight_number, now, flight.coverage_end,
                 )
                 expired_keys.append(key)
                 continue
 
+            # Hold off while an earlier push for this flight is unresolved,
+            # unless it is stuck and due to be replaced
+            pending = self.pending_updates.get(flight.flight_id)
+            if pending and pending.tx_hash and not self._resolve_pending_tx(flight, pending):
+                if not pending.stuck:
+                    self.stats.in_flight += 1
+                    continue
+
             # Fetch from API
-            logger.debug(f"Fetching API data for {flight.flight_number}:{flight.arrival_timestamp}")
+            self.stats.checked += 1
             api_data = await self._fetch_flight_from_api(
                 flight.flight_number, flight.arrival_timestamp
             )
             if not api_data:
-                logger.warning(
-                    f"❌ Flight {flight.flight_number}:{flight.arrival_timestamp} not found in API!"
-                )
+                self.stats.missing += 1
                 continue
 
             api_updated_at = api_data.get("updatedAt", 0)
-            api_status = api_data.get("status", 0)
-            api_delay = api_data.get("delayInMinutes", 0)
-            api_reason = api_data.get("reasonCode", 0)
 
-            logger.debug(
-                f"API data for {flight.flight_number}: "
-                f"status={api_status}, delay={api_delay}min, reason={api_reason}, updatedAt={api_updated_at}"
-            )
+            if api_updated_at <= flight.last_seen_updated_at and not (pending and pending.tx_hash):
+                self.pending_updates.pop(flight.flight_id, None)
+                self.stats.unchanged += 1
+                continue
 
-            # Check if API has newer data
-            if api_updated_at > flight.last_seen_updated_at:
-                # Check if blockchain has this update already
-                chain_updated_at = self.hub.functions.lastUpdatedAtByFlightId(
-                    flight.flight_id
-                ).call()
+            # Coalesce to the newest API state, keeping any stuck transaction's details
+            if pending is None:
+                pending = PendingUpdate(data=api_data, updated_at=api_updated_at, first_seen_at=time.monotonic())
+                self.pending_updates[flight.flight_id] = pending
+            elif api_updated_at > pending.updated_at:
+                pending.data = api_data
+                pending.updated_at = api_updated_at
+                pending.first_seen_at = time.monotonic()
+
+            # Debounce bursts of edits: wait until this updatedAt has been stable for the window
+            if time.monotonic() - pending.first_seen_at < UPDATE_DEBOUNCE_SECONDS:
+                self.stats.debounced += 1
+                continue
 
-                logger.debug(
-                    f"Timestamp comparison for {flight.flight_number}: "
-                    f"API={api_updated_at}, chain={chain_updated_at}, last_seen={flight.last_seen_updated_at}"
-                )
+            # Check if blockchain has this update already
+            chain_updated_at = self.hub.functions.lastUpdatedAtByFlightId(
+                flight.flight_id
+            ).call()
+
+            if pending.updated_at <= chain_updated_at:
+                logger.debug("Chain already has latest update for %s", flight.flight_number)
+                flight.last_seen_updated_at = pending.updated_at
+                if not pending.tx_hash:
+                    del self.pending_updates[flight.flight_id]
+                self.stats.unchanged += 1
+                continue
 
-                if api_updated_at > chain_updated_at:
-                    logger.info(
-                        f"🔄 Pushing update for {flight.flight_number}:\n"
-                        f"   Status: {api_status} (0=Scheduled, 1=OnTime, 2=Delayed, 3=Cancelled, 4=Diverted)\n"
-                        f"   Delay: {api_delay} minutes\n"
-                        f"   Reason code: {api_reason}\n"
-                        f"   API updatedAt: {api_updated_at}\n"
-                        f"   Chain updatedAt: {chain_updated_at}"
-                    )
-                    success = await self._push_flight_update(flight, api_data)
-                    if success:
-                        flight.last_seen_updated_at = api_updated_at
-                        logger.info(f"✅ Update pushed successfully for {flight.flight_number}")
-                    else:
-                        logger.error(f"❌ Failed to push update for {flight.flight_number}")
-                else:
-                    # Chain already has this update
-                    logger.debug(f"Chain already has latest update for {flight.flight_number}")
-                    flight.last_seen_updated_at = api_updated_at
-            else:
-                logger.debug(
-                    f"No new updates for {flight.flight_number} "
-                    f"(api={api_updated_at} <= last_seen={flight.last_seen_updated_at})"
+            logger.debug(
+                "Pushing update for %s: status=%s delay=%smin reason=%s api_updatedAt=%s chain_updatedAt=%s",
+                flight.flight_number,
+                pending.data.get("status", 0),
+                pending.data.get("delayInMinutes", 0),
+                pending.data.get("reasonCode", 0),
+                pending.updated_at,
+                chain_updated_at,
+            )
+            if pending.stuck:
+                # Same nonce, so at most one of the two can be mined; bump gas to replace
+                sent = await self._push_flight_update(
+                    flight, pending.data, nonce=pending.tx_nonce, min_gas_price=pending.tx_gas_price * 9 // 8 + 1
                 )
+            else:
+                sent = await self._push_flight_update(flight, pending.data)
+            if sent:
+                pending.tx_hash, pending.tx_nonce, pending.tx_gas_price = sent
+                pending.tx_updated_at = pending.updated_at
+                pending.sent_at = time.monotonic()
+                pending.stuck = False
+                self.stats.pushed += 1
+            else:
+                # A stuck transaction keeps its hash; wait another timeout before
+                # re-checking its nonce rather than resending on it every cycle
+                if pending.stuck:
+                    pending.stuck = False
+                    pending.sent_at = time.monotonic()
+                self.stats.failed += 1
 
         # Remove expired flights
         for key in expired_keys:
-            del self.tracked_flights[key]
-            logger.info(f"🗑️ Stopped tracking expired flight: {key[0]}:{key[1]}")
+            flight = self.tracked_flights.pop(key)
+            self.pending_updates.pop(flight.flight_id, None)
+            self.stats.expired += 1
+            logger.debug("Stopped tracking expired flight: %s:%s", key[0], key[1])
+
+    def _log_cycle_summary(self) -> None:
+        """Emit one summary record for the cycle and reset the counters."""
+        s = self.stats
+        # Quiet cycles only show up at DEBUG
+        level = logging.INFO if (s.new_policies or s.pushed or s.confirmed or s.failed or s.expired) else logging.DEBUG
+        logger.log(
+            level,
+            "Cycle: tracked=%d new=%d checked=%d unchanged=%d debounced=%d in_flight=%d "
+            "pushed=%d confirmed=%d failed=%d missing=%d expired=%d",
+            len(self.tracked_flights), s.new_policies, s.checked, s.unchanged, s.debounced,
+            s.in_flight, s.pushed, s.confirmed, s.failed, s.missing, s.expired,
+        )
+        s.reset()
 
     async def run(self) -> None:
         """Main loop - discover policies and push updates."""
         logger.info("=" * 60)
         logger.info("🚀 Oracle watcher starting...")
         logger.info("=" * 60)
-        logger.info(f"Configuration:")
-        logger.info(f"  Hub address: {self.hub_address}")
-        logger.info(f"  Oracle address: {self.oracle_account.address}")
-        logger.info(f"  RPC URL: {RPC_URL}")
-        logger.info(f"  API base URL: {API_BASE_URL}")
-        logger.info(f"  Poll interval: {POLL_INTERVAL_SECONDS}s")
+        logger.info("Configuration:")
+        logger.info("  Hub address: %s", self.hub_address)
+        logger.info("  Oracle address: %s", self.oracle_account.address)
+        logger.info("  RPC URL: %s", RPC_URL)
+        logger.info("  API base URL: %s", API_BASE_URL)
+        logger.info("  Poll interval: %ss", POLL_INTERVAL_SECONDS)
+        logger.info("  Update debounce: %ss", UPDATE_DEBOUNCE_SECONDS)
 
         # Verify connection to blockchain
         try:
             block = self.w3.eth.block_number
-            logger.info(f"  Current block: {block}")
+            logger.info("  Current block: %d", block)
             balance = self.w3.eth.get_balance(self.oracle_account.address)
-            logger.info(f"  Oracle balance: {self.w3.from_wei(balance, 'ether')} ETH")
+            logger.info("  Oracle balance: %s ETH", self.w3.from_wei(balance, "ether"))
         except Exception as e:
-            logger.error(f"❌ Failed to connect to blockchain: {e}")
+            logger.error("❌ Failed to connect to blockchain: %s", e)
             return
 
         # Verify connection to API
         try:
             response = await self.http_client.get("/health")
             if response.status_code == 200:
-                logger.info(f"  API health: OK")
+                logger.info("  API health: OK")
             else:
-                logger.warning(f"  API health check failed: {response.status_code}")
+                logger.warning("  API health check failed: %s", response.status_code)
         except Exception as e:
-            logger.warning(f"  API not reachable: {e}")
+            logger.warning("  API not reachable: %s", e)
 
         logger.info("=" * 60)
         logger.info("Watching for policies and flight updates...")
@@ -409,8 +642,8 @@ class OracleWatcher:
                 # Process tracked flights
                 if self.tracked_flights:
                     await self._process_tracked_flights()
-                else:
-                    logger.debug("No flights to track yet")
+
+                self._log_cycle_summary()
 
                 await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
@@ -418,11 +651,12 @@ class OracleWatcher:
                 logger.info("Shutting down...")
                 break
             except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+                logger.error("Error in main loop: %s", e, exc_info=True)
                 await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
 
 async def main():
+    setup_logging()
     watcher = OracleWatcher()
     await watcher.run()
 
@@ -10,6 +10,7 @@ import { Plus, FileText, Shield, Clock, Wallet, Loader2, RefreshCw } from "lucid
 import Link from "next/link"
 import { useWallet } from "@/hooks/use-wallet"
 import { blockchain, Policy } from "@/lib/services/blockchain"
+import { flightApi } from "@/lib/services/flight-api"
 import { config, PolicyStatus, FlightStatus } from "@/lib/config"
 
 export interface Contract {
@@ -138,8 +139,25 @@ export default function DashboardPage() {
       // Initialize blockchain with RPC for reading
       await blockchain.initWithRpc()
 
-      // Fetch policies for the connected address
-      const policies = await blockchain.getPoliciesByHolder(address)
+      // Use the API event index only when it has caught up with the chain head;
+      // otherwise it may be missing recent purchases or settlements
+      let policies: Policy[] | null = null
+      try {
+        const [indexedBlock, headBlock] = await Promise.all([
+          flightApi.getIndexLastBlock(),
+          blockchain.getBlockNumber(),
+        ])
+        if (indexedBlock !== null && indexedBlock >= headBlock) {
+          policies = await flightApi.getPoliciesByHolder(address)
+        } else {
+          console.warn(`Event index behind chain (indexed: ${indexedBlock}, head: ${headBlock}), reading on-chain`)
+        }
+      } catch (indexErr) {
+        console.warn("Event index unavailable, reading policies on-chain:", indexErr)
+      }
+      if (policies === null) {
+        policies = await blockchain.getPoliciesByHolder(address)
+      }
 
       // Convert to contract format
       const contractPromises = policies.map(policyToContract)
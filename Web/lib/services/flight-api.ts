@@ -1,6 +1,7 @@
 // Service for interacting with the Flight Simulator API
 
-import { config, FlightStatus } from "../config"
+import { config, FlightStatus, PolicyStatus } from "../config"
+import type { Policy } from "./blockchain"
 
 export interface ApiFlight {
   flightNumber: string
@@ -27,6 +28,25 @@ export interface FlightUpdateRequest {
   reasonCode?: number
 }
 
+// Policy as served by the API event index (uint256 amounts as decimal strings)
+export interface IndexedPolicy {
+  policyId: number
+  holder: string
+  productId: number
+  flightId: string
+  flightNumber: string
+  arrivalTimestamp: number
+  premiumPaid: string
+  maxPayout: string
+  purchasedAt: number
+  coverageEnd: number
+  status: PolicyStatus
+  payoutWei: string | null
+  closedAt: number | null
+  txHash: string
+  closedTxHash: string | null
+}
+
 class FlightApiService {
   private baseUrl: string
 
@@ -112,6 +132,42 @@ class FlightApiService {
     return response.status === 204
   }
 
+  /**
+   * Get the last block ingested by the API event index (null if it never ran)
+   */
+  async getIndexLastBlock(): Promise<number | null> {
+    const response = await fetch(`${this.baseUrl}/index/status`)
+    if (!response.ok) {
+      throw new Error(`Failed to fetch index status: ${response.statusText}`)
+    }
+    const status: { lastBlock: number | null } = await response.json()
+    return status.lastBlock
+  }
+
+  /**
+   * Get all policies for a holder from the API event index (single request)
+   */
+  async getPoliciesByHolder(holder: string): Promise<Policy[]> {
+    const response = await fetch(`${this.baseUrl}/index/holders/${holder}/policies`)
+    if (!response.ok) {
+      throw new Error(`Failed to fetch indexed policies: ${response.statusText}`)
+    }
+    const policies: IndexedPolicy[] = await response.json()
+    return policies.map((p) => ({
+      policyId: BigInt(p.policyId),
+      holder: p.holder,
+      productId: p.productId,
+      flightId: p.flightId,
+      flightNumber: p.flightNumber,
+      arrivalTimestamp: p.arrivalTimestamp,
+      premiumPaid: BigInt(p.premiumPaid),
+      maxPayout: BigInt(p.maxPayout),
+      purchasedAt: p.purchasedAt,
+      coverageEnd: p.coverageEnd,
+      status: p.status,
+    }))
+  }
+
   /**
    * Ensure a flight exists in the API (create if not exists)
    */